@@ -90,7 +90,8 @@ def aggregate_page_pings(df: pd.DataFrame):
     """
     pings = df[df["event_name"] == Event.PAGE_PING.value]
     grouped_df = (
-        pings.groupby(["client_id", "landing_page_path", "session_date"])
+        # observed=True keeps categorical keys from expanding into every unseen combination
+        pings.groupby(["client_id", "landing_page_path", "session_date"], observed=True)
         .agg({"event_name": "count", "activity_time": "first"})
         .reset_index()
         .rename(columns={"event_name": "ping_count"})
@@ -42,16 +42,19 @@ def scrape_upload_metadata(site: Site, dts: List[datetime]) -> Tuple[List[Articl
     logging.info("Fetching paths to update...")
     df = warehouse.get_paths_to_update(site, dts)
 
-    # New paths are the ones where the external ID is null
-    new_paths = list(df[df["external_id"].isna()]["landing_page_path"])
-    create_results, create_errors = scrape_and_create_articles(
-        site,
-        new_paths,
-    )
+    # Share one worker pool across the create and update passes instead of spinning one up per step
+    with ThreadPoolExecutor(max_workers=site.scrape_config["concurrent_requests"]) as executor:
+        # New paths are the ones where the external ID is null
+        new_paths = list(df[df["external_id"].isna()]["landing_page_path"])
+        create_results, create_errors = scrape_and_create_articles(
+            site,
+            new_paths,
+            executor,
+        )
 
-    # Paths to refresh are the ones where the external ID is not null
-    refresh_ext_ids = list(df["external_id"].dropna().unique())
-    update_results, update_errors = scrape_and_update_articles(site, refresh_ext_ids)
+        # Paths to refresh are the ones where the external ID is not null
+        refresh_ext_ids = list(df["external_id"].dropna().unique())
+        update_results, update_errors = scrape_and_update_articles(site, refresh_ext_ids, executor)
 
     all_errors = create_errors + update_errors
 
@@ -121,33 +124,32 @@ def extract_external_id(site: Site, path: str) -> str:
     return site.extract_external_id(path)
 
 
-def extract_external_ids(site: Site, landing_page_paths: List[str]) -> List[Union[str, ArticleScrapingError]]:
+def extract_external_ids(
+    site: Site, landing_page_paths: List[str], executor: ThreadPoolExecutor
+) -> List[Union[str, ArticleScrapingError]]:
     """
     Attempts to extract externalIDs from a list of URLs
     :param landing_page_paths: List of unique landing page paths
+    :param executor: Thread pool used to run the extractions concurrently
     :return: list of "external_id" in the same order as the input, or ArticleScrapingError
         if the extraction failed
     """
     futures_list = []
     results: List[Union[str, ArticleScrapingError]] = []
 
-    with ThreadPoolExecutor(max_workers=site.scrape_config["concurrent_requests"]) as executor:
-        for path in landing_page_paths:
-            future = executor.submit(extract_external_id, site, path=path)
-            futures_list.append((path, future))
-
-        for (path, future) in futures_list:
-            try:
-                result = future.result(timeout=60)
-                results.append(result)
-            except ArticleScrapingError as e:
-                logging.warning(
-                    "Failed to scrape external ID. "
-                    + f"Path: {e.path}. "
-                    + f"Type: {e.error_type}. "
-                    + f"Message: {e.msg}"
-                )
-                results.append(e)
+    for path in landing_page_paths:
+        future = executor.submit(extract_external_id, site, path=path)
+        futures_list.append((path, future))
+
+    for (path, future) in futures_list:
+        try:
+            result = future.result(timeout=60)
+            results.append(result)
+        except ArticleScrapingError as e:
+            logging.warning(
+                "Failed to scrape external ID. " + f"Path: {e.path}. " + f"Type: {e.error_type}. " + f"Message: {e.msg}"
+            )
+            results.append(e)
     return results
 
 
@@ -171,40 +173,43 @@ def scrape_article(site: Site, article: Union[Article, ArticleScrapingError]) ->
     return article
 
 
-def scrape_articles(site: Site, articles: List[Article]) -> Tuple[List[Article], List[ArticleScrapingError]]:
+def scrape_articles(
+    site: Site, articles: List[Article], executor: ThreadPoolExecutor
+) -> Tuple[List[Article], List[ArticleScrapingError]]:
     """
-    Use a concurrent thread pool to scrape each of the input articles.
+    Use the concurrent thread pool to scrape each of the input articles.
     Return a list of Article objects with updated, scraped metadata
         and ArticleScrapingError if the article could not be scraped.
     """
     futures_list = []
     results: List[Article] = []
     errors: List[ArticleScrapingError] = []
-    with ThreadPoolExecutor(max_workers=site.scrape_config["concurrent_requests"]) as executor:
-        for article in articles:
-            future = executor.submit(scrape_article, site, article=article)
-            futures_list.append(future)
-        for future in futures_list:
-            try:
-                result = future.result(timeout=60)
-                results.append(result)
-            except ArticleScrapingError as e:
-                logging.warning(
-                    f"Failed to scrape article!! " + f"Path: {e.path}. " + f"Type: {e.error_type}. " + f"Message: {e.msg}"
-                )
-                errors.append(e)
+    for article in articles:
+        future = executor.submit(scrape_article, site, article=article)
+        futures_list.append(future)
+    for future in futures_list:
+        try:
+            result = future.result(timeout=60)
+            results.append(result)
+        except ArticleScrapingError as e:
+            logging.warning(
+                f"Failed to scrape article!! " + f"Path: {e.path}. " + f"Type: {e.error_type}. " + f"Message: {e.msg}"
+            )
+            errors.append(e)
 
     logging.info(f"Scraped {len(results)} records")
     return results, errors
 
 
-def new_articles_from_paths(site: Site, paths: List[str]) -> Tuple[List[Article], List[ArticleScrapingError]]:
+def new_articles_from_paths(
+    site: Site, paths: List[str], executor: ThreadPoolExecutor
+) -> Tuple[List[Article], List[ArticleScrapingError]]:
     """
     Given a list of path strings, return two lists. the first is a list of valid Article objects
     that need to be scraped and written to the DB. the second is a list of ArticleScrapingErrors
     """
     # First, extract external IDs from the paths
-    external_ids = extract_external_ids(site, paths)
+    external_ids = extract_external_ids(site, paths, executor)
     existing_external_ids = set(get_existing_external_ids(site, [e for e in external_ids if isinstance(e, str)]))
 
     new_articles = []
@@ -222,7 +227,9 @@ def new_articles_from_paths(site: Site, paths: List[str]) -> Tuple[List[Article]
     return new_articles, errors
 
 
-def scrape_and_create_articles(site: Site, paths: List[str]) -> Tuple[List[Article], List[ArticleScrapingError]]:
+def scrape_and_create_articles(
+    site: Site, paths: List[str], executor: ThreadPoolExecutor
+) -> Tuple[List[Article], List[ArticleScrapingError]]:
     """
     Given a Site and list of paths (or external ID scrape errors),
     fetch the article, scrape associated metadata, and save articles and paths to the database
@@ -231,8 +238,8 @@ def scrape_and_create_articles(site: Site, paths: List[str]) -> Tuple[List[Artic
     ArticleScrapeErrors are given for articles that failed to be created
     """
     logging.info(f"Inspecting {len(paths)} new paths")
-    articles, errors = new_articles_from_paths(site, paths)
-    results, scrape_errors = scrape_articles(site, articles)
+    articles, errors = new_articles_from_paths(site, paths, executor)
+    results, scrape_errors = scrape_articles(site, articles, executor)
     errors = errors + scrape_errors
 
     to_create = []
@@ -254,7 +261,9 @@ def scrape_and_create_articles(site: Site, paths: List[str]) -> Tuple[List[Artic
     return results, errors
 
 
-def scrape_and_update_articles(site: Site, external_ids: List[str]) -> Tuple[List[Article], List[ArticleScrapingError]]:
+def scrape_and_update_articles(
+    site: Site, external_ids: List[str], executor: ThreadPoolExecutor
+) -> Tuple[List[Article], List[ArticleScrapingError]]:
     """
     Given a site and a list of article objects that need to be updated,
     scrape them and then submit the updated article objects to the database
@@ -266,7 +275,7 @@ def scrape_and_update_articles(site: Site, external_ids: List[str]) -> Tuple[Lis
 
     articles = get_articles_by_external_ids(site, external_ids)
 
-    results, errors = scrape_articles(site, articles)
+    results, errors = scrape_articles(site, articles, executor)
 
     # WCP: Delete any sponsored (excluded) articles from the DB that had a tag-exclude scraping error
     if site.name == Sites.WCP.name:
@@ -1,12 +1,18 @@
+import random
+import threading
 import time
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Dict, List, Optional
+from itertools import takewhile
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
 
 import pandas as pd
 import requests as req
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 from requests.models import Response
-from retrying import retry
+from urllib3.util.retry import Retry
 
 GOOGLE_TAG_MANAGER_RAW_FIELDS = {
     "collector_tstamp",
@@ -15,6 +21,51 @@ GOOGLE_TAG_MANAGER_RAW_FIELDS = {
     "page_urlpath",
 }
 
+HEADERS = {"User-Agent": "article-rec-training-job/1.0.0"}
+
+
+class JitteredRetry(Retry):
+    """
+    urllib3 1.26's Retry doesn't wait at all before the first retry and has no jitter (backoff_jitter is 2.x only),
+    so compute the wait here: backoff_factor * 2 ** (n - 1) for the n-th consecutive retry, plus up to JITTER seconds
+    """
+
+    JITTER = 1.0
+    # Servers can ask for very long waits (Retry-After: 3600). urllib3 sleeps for whatever is asked inside
+    # SESSION.get, which would hold a scrape worker far past the step's per-future timeout, so cap it.
+    MAX_RETRY_AFTER = 10.0
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        return min(super().parse_retry_after(retry_after), self.MAX_RETRY_AFTER)
+
+    def get_backoff_time(self) -> float:
+        # Like urllib3, only count the trailing run of errors and ignore redirects
+        consecutive_errors = len(list(takewhile(lambda x: x.redirect_location is None, reversed(self.history))))
+        if consecutive_errors == 0:
+            return 0
+        return self.backoff_factor * 2 ** (consecutive_errors - 1) + random.uniform(0, self.JITTER)
+
+
+# Retry connection errors and transient HTTP errors up to twice, waiting 2s then 4s (each plus up to 1s of jitter,
+# so threads that failed together don't retry in lockstep).
+# For 429 and 503 responses, a Retry-After header from the server takes precedence over the backoff,
+# up to JitteredRetry.MAX_RETRY_AFTER seconds.
+# These retries happen inside the session's adapter, so they don't go through the per-host RateLimiter in safe_get.
+RETRY = JitteredRetry(
+    total=2,
+    backoff_factor=2,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Shared by every site and scraping thread so connections (and TLS sessions) to each host are kept alive
+# between requests. The default pool of 10 connections per host is above any site's concurrent_requests.
+SESSION = req.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(max_retries=RETRY))
+SESSION.mount("http://", HTTPAdapter(max_retries=RETRY))
+
 # Custom types
 ResponseValidator = Callable[[Response], Optional[str]]
 
@@ -39,13 +90,21 @@ def transform_data_google_tag_manager(df: pd.DataFrame) -> pd.DataFrame:
                         - event_category (conversions, newsletter sign-ups TK)
                             - event_action (conversions, newsletter sign-ups TK)
     """
-    transformed_df = pd.DataFrame()
-    transformed_df["client_id"] = df["domain_userid"]
-    transformed_df["activity_time"] = pd.to_datetime(df.collector_tstamp).dt.round("1s")
-    transformed_df["session_date"] = pd.to_datetime(transformed_df.activity_time.dt.date)
-    transformed_df["landing_page_path"] = df.page_urlpath
-    transformed_df["event_name"] = df.event_name
-    transformed_df["event_name"] = transformed_df["event_name"].astype("category")
+    # Parse timestamps once and derive the session date from them instead of round-tripping through Python dates
+    activity_time = pd.to_datetime(df["collector_tstamp"]).dt.round("1s")
+    # session_date must stay a naive midnight timestamp, which to_csv writes as YYYY-MM-DD for Redshift's COPY.
+    # Drop any timezone (keeping the local wall-clock date, like .dt.date did) before normalizing.
+    session_time = activity_time.dt.tz_localize(None) if activity_time.dt.tz is not None else activity_time
+    transformed_df = pd.DataFrame(
+        {
+            "client_id": df["domain_userid"],
+            "activity_time": activity_time,
+            "session_date": session_time.dt.normalize(),
+            # Paths repeat heavily across events, so store them as integer codes
+            "landing_page_path": df["page_urlpath"].astype("category"),
+            "event_name": df["event_name"].astype("category"),
+        }
+    )
 
     return transformed_df
 
@@ -75,34 +134,100 @@ class ArticleBulkScrapingError(Exception):
         self.msg = msg
 
 
-@retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000)
+class RateLimiter:
+    """
+    Paces requests so that no more than `requests_per_second` of them start each second,
+    no matter how many scraping threads share the limiter
+    """
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1 / requests_per_second
+        self.next_start = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            start = max(self.next_start, now)
+            self.next_start = start + self.interval
+        time.sleep(start - now)
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(url: str, requests_per_second: float) -> RateLimiter:
+    """One limiter per host, shared by every thread requesting from it"""
+    host = urlparse(url).netloc
+    with _rate_limiters_lock:
+        if host not in _rate_limiters:
+            _rate_limiters[host] = RateLimiter(requests_per_second)
+        return _rate_limiters[host]
+
+
 def safe_get(
     url: str,
     headers: Dict[str, str] = None,
     params: Optional[Dict] = None,
     scrape_config={},
+    stream: bool = False,
 ) -> req.Response:
     TIMEOUT_SECONDS = 30
-    default_headers = {"User-Agent": "article-rec-training-job/1.0.0"}
-    if headers:
-        default_headers.update(headers)
-    page = req.get(url, timeout=TIMEOUT_SECONDS, params=params, headers=default_headers)
-
-    # Many times, the request hits a 4xx or 5xx, but no exception is raised
-    # This makes sure an exception is raised and allows the retry decorator to work.
-    #
-    # Some notes:
-    # - Since we already have exponential backoff, no need to treat 429 error any differently.
-    # - During the last retry attempt, if this still raises an exception, that exception's already handled
-    # by a try-except block in each site's fetch_article method.
-    page.raise_for_status()
-
     if scrape_config.get("requests_per_second"):
-        time.sleep(1 / scrape_config["requests_per_second"])
+        get_rate_limiter(url, scrape_config["requests_per_second"]).wait()
+
+    # Extra headers (e.g. an API token) are merged with the session's default headers by requests
+    page = SESSION.get(url, timeout=TIMEOUT_SECONDS, params=params, headers=headers, stream=stream)
+
+    # Transient errors (see RETRY) have already been retried by the session's adapter at this point.
+    # Any 4xx or 5xx left doesn't raise by itself, so make sure an exception is raised;
+    # it's handled by a try-except block in each site's fetch_article method.
+    page.raise_for_status()
 
     return page
 
 
+def release_stream(page: Response, max_bytes: int) -> None:
+    """
+    Finish reading a streamed response whose body is no more than max_bytes from done, so its connection goes
+    back to SESSION's pool. Closing a stream before the body has been read makes urllib3 drop the socket, and the
+    next request to that host pays a new TCP and TLS handshake. Longer bodies are left to be closed.
+    """
+    content_length = page.headers.get("Content-Length")
+    if content_length is not None and int(content_length) - page.raw.tell() > max_bytes:
+        return
+
+    # Without a Content-Length (chunked responses), read up to max_bytes and give up if the body doesn't end
+    read = 0
+    for chunk in page.raw.stream(max_bytes, decode_content=False):
+        read += len(chunk)
+        if read > max_bytes:
+            return
+
+
+def get_json(page: Response) -> Any:
+    """
+    Decode a response's JSON body once and hand the same object to every later caller,
+    e.g. a response validator followed by the metadata scraper
+    """
+    if not hasattr(page, "_parsed_json"):
+        setattr(page, "_parsed_json", page.json())
+    return getattr(page, "_parsed_json")
+
+
+def get_soup(page: Response, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse a response's HTML once with the C-based lxml parser and hand the same tree to every later caller,
+    e.g. a response validator followed by the metadata scraper.
+    parse_only only applies to the first call, so every caller for a site should pass the same strainer
+    """
+    if not hasattr(page, "_soup"):
+        # Raw bytes skip requests' str decode; the document's own charset declaration is used instead
+        setattr(page, "_soup", BeautifulSoup(page.content, features="lxml", parse_only=parse_only))
+    return getattr(page, "_soup")
+
+
 def validate_response(page: Response, validate_funcs: List[ResponseValidator]) -> Optional[str]:
     # Go through validation functions one by one, stop as soon as a message gets returned
     for func in validate_funcs:
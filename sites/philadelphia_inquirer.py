@@ -10,6 +10,7 @@ from sites.helpers import (
     ArticleBulkScrapingError,
     ArticleScrapingError,
     ScrapeFailure,
+    get_json,
     ms_timestamp,
     safe_get,
     transform_data_google_tag_manager,
@@ -179,6 +180,14 @@ def get_external_id(res_val: dict) -> str:
     return external_id
 
 
+PARSE_KEYS = (
+    ("title", get_headline),
+    ("path", get_path),
+    ("published_at", get_date),
+    ("external_id", get_external_id),
+)
+
+
 def parse_article_metadata(page: Union[Response, dict], external_id: str, path: str) -> dict:
     """ARC API JSON parser
 
@@ -188,19 +197,12 @@ def parse_article_metadata(page: Union[Response, dict], external_id: str, path:
     """
 
     metadata = {}
-    parse_keys = [
-        ("title", get_headline),
-        ("path", get_path),
-        ("published_at", get_date),
-        ("external_id", get_external_id),
-    ]
-
     if isinstance(page, dict):
         res = page
     else:
-        res = page.json()
+        res = get_json(page)
 
-    for prop, func in parse_keys:
+    for prop, func in PARSE_KEYS:
         val = None
         try:
             val = func(res)
@@ -218,7 +220,7 @@ def validate_attributes(res: Response) -> Optional[str]:
     :return: None if no errors; otherwise string describing validation issue
     """
     try:
-        content = res.json()
+        content = get_json(res)
     except Exception as e:
         return f"Cannot parse article response JSON: {e}"
 
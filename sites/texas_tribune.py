@@ -1,10 +1,11 @@
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
 from requests.models import Response
 
 from sites.helpers import (
@@ -12,6 +13,7 @@ from sites.helpers import (
     ArticleBulkScrapingError,
     ArticleScrapingError,
     ScrapeFailure,
+    release_stream,
     safe_get,
     transform_data_google_tag_manager,
 )
@@ -40,10 +42,14 @@ TRAINING_PARAMS = {
 }
 
 SCRAPE_CONFIG = {
-    "concurrent_requests": 1,
+    "concurrent_requests": 2,
     "requests_per_second": 2,
 }
 
+API_URL = f"https://{DOMAIN}/api/v2/articles"
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+PAGE_SIZE = 100
+
 NON_ARTICLE_PREFIXES = [
     "/districts",
     "/employees",
@@ -55,8 +61,6 @@ NON_ARTICLE_PREFIXES = [
     "/about",
     "/series",
     "/all",
-    "/departments",
-    "/about",
     "/program",
     "/events",
     "/library",
@@ -68,36 +72,86 @@ NON_ARTICLE_PREFIXES = [
     "/support-us",
     "/session",
 ]
+# One anchored alternation, so a path is checked against every prefix in a single match call
+NON_ARTICLE_PROG = re.compile("|".join(re.escape(prefix) for prefix in NON_ARTICLE_PREFIXES))
+
+# e.g. contentID: '38319', inside an inline <script> on article pages.
+# Matched against the raw bytes so the body never has to be decoded.
+CONTENT_ID_PROG = re.compile(rb"contentID: '(\d+)'")
 
 
 def bulk_fetch(start_date: date, end_date: date) -> List[Dict[str, Any]]:
     logging.info(f"Fetching articles from {start_date} to {end_date}")
 
-    API_URL = f"https://{DOMAIN}/api/v2/articles"
-    DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
     # texas tribune publishes 5-10 articles per day
-    params = {"start_date": start_date.strftime(DATE_FORMAT), "end_date": end_date.strftime(DATE_FORMAT), "limit": 100}
-
-    try:
-        res = safe_get(API_URL, params=params, scrape_config=SCRAPE_CONFIG)
-    except Exception as e:
-        raise ArticleBulkScrapingError(ScrapeFailure.FETCH_ERROR, msg=str(e)) from e
-    json_res = res.json()
+    params = {
+        "start_date": start_date.strftime(DATE_FORMAT),
+        "end_date": end_date.strftime(DATE_FORMAT),
+        "limit": PAGE_SIZE,
+    }
 
-    metadata = [parse_metadata(article) for article in json_res["results"]]
+    def fetch_page(offset: int) -> Tuple[int, List[Dict[str, Any]]]:
+        try:
+            res = safe_get(API_URL, params={**params, "offset": offset}, scrape_config=SCRAPE_CONFIG)
+            json_res = res.json()
+            return json_res.get("count", 0), json_res["results"]
+        except Exception as e:
+            raise ArticleBulkScrapingError(ScrapeFailure.FETCH_ERROR, msg=str(e)) from e
+
+    # The API paginates its results. The first page reports the total count,
+    # so any remaining pages can be requested concurrently instead of following "next" links one by one.
+    # Step by the number of rows the server actually returned, which may be capped below PAGE_SIZE.
+    count, results = fetch_page(0)
+    page_size = len(results)
+    if page_size:
+        with ThreadPoolExecutor(max_workers=SCRAPE_CONFIG["concurrent_requests"]) as executor:
+            for _, page in executor.map(fetch_page, range(page_size, count, page_size)):
+                # Articles can be unpublished between requests, so the count may overshoot
+                if not page:
+                    break
+                results.extend(page)
+
+    metadata = [parse_metadata(article) for article in results]
     return metadata
 
 
+def find_content_id(article_url: str) -> Optional[str]:
+    """
+    Stream an article page and stop as soon as the contentID token has been seen.
+    It sits in an inline <script> near the top of the document, so the page is usually matched in the first chunk.
+
+    Stopping early has a cost: a connection whose body wasn't read to the end can't go back to SESSION's pool,
+    so the next lookup opens a new TCP and TLS connection. When no more than DRAIN_LIMIT bytes are left, reading
+    them is cheaper than that handshake, so the rest is drained and the connection reused. Pages with a longer
+    tail are still cut off, and those lookups do pay for a new connection.
+    """
+    CHUNK_SIZE = 64 * 1024
+    DRAIN_LIMIT = 256 * 1024
+    # Enough trailing bytes to catch a token split across two chunks
+    OVERLAP = 64
+    with safe_get(article_url, scrape_config=SCRAPE_CONFIG, stream=True) as page:
+        content = bytearray()
+        for chunk in page.iter_content(chunk_size=CHUNK_SIZE):
+            # Only rescan the newly arrived bytes, not everything read so far
+            start = max(len(content) - OVERLAP, 0)
+            content += chunk
+            matched = CONTENT_ID_PROG.search(content, start)
+            if matched:
+                release_stream(page, DRAIN_LIMIT)
+                return str(int(matched.group(1)))
+    return None
+
+
+# Extracting an ID costs a page fetch, so remember results for paths seen earlier in the run.
+# Failed extractions raise and are not cached.
+@lru_cache(maxsize=50_000)
 def extract_external_id(path: str) -> str:
-    for prefix in NON_ARTICLE_PREFIXES:
-        if path.startswith(prefix):
-            raise ArticleScrapingError(
-                ScrapeFailure.NO_EXTERNAL_ID, path, external_id=None, msg="Skipping non-article path"
-            )
+    if NON_ARTICLE_PROG.match(path):
+        raise ArticleScrapingError(ScrapeFailure.NO_EXTERNAL_ID, path, external_id=None, msg="Skipping non-article path")
 
     article_url = f"https://{DOMAIN}{path}"
     try:
-        page = safe_get(article_url, scrape_config=SCRAPE_CONFIG)
+        external_id = find_content_id(article_url)
     except Exception as e:
         raise ArticleScrapingError(
             ScrapeFailure.FETCH_ERROR,
@@ -105,15 +159,8 @@ def extract_external_id(path: str) -> str:
             external_id=None,
             msg=f"API request failed for {article_url}",
         ) from e
-    soup = BeautifulSoup(page.text, features="html.parser")
-
-    token = None
-    html_content = soup.html
-    matched = re.search(r"contentID: '\d+'", str(html_content))
-    if matched and matched.group(0):
-        token = matched.group(0)
-        contentID = token.split("'")[1]
-        return str(int(contentID))
+    if external_id:
+        return external_id
     else:
         raise ArticleScrapingError(
             ScrapeFailure.NO_EXTERNAL_ID,
@@ -123,50 +170,26 @@ def extract_external_id(path: str) -> str:
         )
 
 
-def get_title(res: dict) -> str:
-    title = res["headline"]
-    return title
-
-
-def get_published_at(res: dict) -> str:
-    # example published_at: '2021-11-12T12:45:35-06:00'
-    pub_date = res["pub_date"]
-    return pub_date
-
-
-def get_path(page: dict) -> str:
-    # there are times when older articles redirect to an alternate path, for ex:
-    # https://washingtoncitypaper.com/food/article/20830693/awardwinning-chef-michel-richard-dies-at-age-68
-    return urlparse(page["url"]).path
-
-
-def get_external_id(page: dict) -> str:
-    external_id = page["id"]
-    return external_id
-
-
 def parse_metadata(
     api_info: Dict[str, Any], external_id: Optional[str] = None, path: Optional[str] = None
 ) -> Dict[str, Any]:
-    metadata = {}
-    parsers = [
-        ("title", get_title),
-        ("published_at", get_published_at),
-        ("path", get_path),
-        ("external_id", get_external_id),
-    ]
-    for prop, func in parsers:
-        try:
-            val = func(api_info)
-        except Exception as e:
-            if not external_id:
-                external_id = "no_id_obtained"
-            if not path:
-                path = "no_path_obtained"
-            raise ArticleScrapingError(
-                ScrapeFailure.MALFORMED_RESPONSE, external_id, path, "Error parsing metadata for article"
-            ) from e
-        metadata[prop] = val
+    try:
+        metadata = {
+            "title": api_info["headline"],
+            # example published_at: '2021-11-12T12:45:35-06:00'
+            "published_at": api_info["pub_date"],
+            # there are times when older articles redirect to an alternate path, for ex:
+            # https://washingtoncitypaper.com/food/article/20830693/awardwinning-chef-michel-richard-dies-at-age-68
+            "path": urlparse(api_info["url"]).path,
+            "external_id": api_info["id"],
+        }
+    except Exception as e:
+        raise ArticleScrapingError(
+            ScrapeFailure.MALFORMED_RESPONSE,
+            path or "no_path_obtained",
+            external_id or "no_id_obtained",
+            "Error parsing metadata for article",
+        ) from e
 
     return metadata
 
@@ -184,9 +207,8 @@ def fetch_article(
     external_id: str,
     path: str,
 ) -> Response:
-    external_id = int(external_id)  # type: ignore
-
-    api_url = f"https://{DOMAIN}/api/v2/articles/{external_id}"
+    # external_id is already normalized to an integer string by extract_external_id
+    api_url = f"{API_URL}/{external_id}"
 
     try:
         res = safe_get(api_url, scrape_config=SCRAPE_CONFIG)
@@ -1,15 +1,18 @@
 import re
+import string
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from requests.models import Response
 
 from sites.helpers import (
     GOOGLE_TAG_MANAGER_RAW_FIELDS,
     ArticleScrapingError,
     ScrapeFailure,
+    get_soup,
     safe_get,
     transform_data_google_tag_manager,
     validate_response,
@@ -41,8 +44,19 @@ SCRAPE_CONFIG = {
 # supported url path formats:
 # '/v/s/washingtoncitypaper.com/article/194506/10-things-you-didnt-know-about-steakumm/'
 # '/article/521676/jack-evans-will-pay-2000-a-month-in-latest-ethics-settlement/'
-PATH_PATTERN = rf"\/((v|c)\/s\/{DOMAIN}\/)?article\/(\d+)\/\S+"
-PATH_PROG = re.compile(PATH_PATTERN)
+PATH_PATTERN = rf"/(?:[vc]/s/{re.escape(DOMAIN)}/)?article/(\d+)/\S+"
+# ASCII: ids are plain 0-9 digits, and \S only has to rule out ASCII whitespace
+PATH_PROG = re.compile(PATH_PATTERN, re.ASCII)
+PUBLISHED_AT_PROPERTY = "article:published_time"
+
+
+def is_scraped_element(name: str, attrs: dict) -> bool:
+    return name in ("header", "meta") or attrs.get("id") == "primary"
+
+
+# Only build the parts of the page that get read: the title header, meta tags and the #primary content area.
+# Matching elements keep their whole subtree, so "header h1" and "#primary .tag-exclude" still resolve.
+STRAINER = SoupStrainer(is_scraped_element)
 
 # TODO: Once merged Site object PR, make this a WCP class attribute
 ERROR_MSG_TAG_EXCLUDE = "Article has exclude tag"
@@ -52,63 +66,72 @@ def bulk_fetch(start_date: date, end_date: date) -> List[Dict[str, Any]]:
     raise NotImplementedError
 
 
-def extract_external_id(path: str) -> str:
-    result = PATH_PROG.match(path)
-    if result:
-        return result.groups()[2]
+def split_external_id(path: str) -> Optional[str]:
+    """
+    Fast path for the two supported formats using plain string splits; returns None when
+    the path doesn't have exactly that shape so the regex can make the final call
+    """
+    parts = path.split("/", 3)
+    if parts[0] == "" and len(parts) == 4 and parts[1] == "article":
+        external_id, slug = parts[2], parts[3]
     else:
-        raise ArticleScrapingError(
-            ScrapeFailure.NO_EXTERNAL_ID, path, external_id=None, msg="External ID not found in path"
-        )
+        parts = path.split("/", 6)
+        if len(parts) != 7 or parts[:5] not in (["", "v", "s", DOMAIN, "article"], ["", "c", "s", DOMAIN, "article"]):
+            return None
+        external_id, slug = parts[5], parts[6]
 
+    if external_id.isascii() and external_id.isdigit() and slug and slug[0] not in string.whitespace:
+        return external_id
+    return None
 
-def scrape_title(page: Response, soup: BeautifulSoup) -> str:
-    headers = soup.select("header h1")
-    return headers[0].text.strip()
 
+# The same article paths recur across many events, so remember the outcome per path,
+# misses included (they're returned as None and raised by the caller).
+@lru_cache(maxsize=65_536)
+def find_external_id(path: str) -> Optional[str]:
+    external_id = split_external_id(path)
+    if external_id:
+        return external_id
 
-def scrape_published_at(page: Response, soup: BeautifulSoup) -> str:
-    # example published_at: '2021-04-13T19:00:45+00:00'
-    PROPERTY_TAG = "article:published_time"
-    tag = soup.find("meta", property=PROPERTY_TAG)
-    return tag.get("content") if tag is not None else None
+    result = PATH_PROG.match(path)
+    return result.group(1) if result else None
 
 
-def scrape_path(page: Response, soup: BeautifulSoup) -> str:
-    # there are times when older articles redirect to an alternate path, for ex:
-    # https://washingtoncitypaper.com/food/article/20830693/awardwinning-chef-michel-richard-dies-at-age-68
-    return urlparse(page.url).path
+def extract_external_id(path: str) -> str:
+    external_id = find_external_id(path)
+    if external_id:
+        return external_id
+    else:
+        raise ArticleScrapingError(
+            ScrapeFailure.NO_EXTERNAL_ID, path, external_id=None, msg="External ID not found in path"
+        )
 
 
 def scrape_article_metadata(page: Response, external_id: str, path: str) -> dict:
-    soup = BeautifulSoup(page.text, features="html.parser")
-    metadata = {}
-    scraper_funcs = [
-        ("title", scrape_title),
-        ("published_at", scrape_published_at),
-        ("path", scrape_path),
-    ]
-
-    for prop, func in scraper_funcs:
-        try:
-            val = func(page, soup)
-        except Exception as e:
-            raise ArticleScrapingError(
-                ScrapeFailure.MALFORMED_RESPONSE, path, external_id, f"Error scraping {prop} for article path"
-            ) from e
-        metadata[prop] = val
+    soup = get_soup(page, parse_only=STRAINER)
+    try:
+        # example published_at: '2021-04-13T19:00:45+00:00'
+        published_at_tag = soup.find("meta", property=PUBLISHED_AT_PROPERTY)
+        metadata = {
+            "title": soup.select_one("header h1").text.strip(),
+            "published_at": published_at_tag.get("content") if published_at_tag is not None else None,
+            # there are times when older articles redirect to an alternate path, for ex:
+            # https://washingtoncitypaper.com/food/article/20830693/awardwinning-chef-michel-richard-dies-at-age-68
+            "path": urlsplit(page.url).path,
+        }
+    except Exception as e:
+        raise ArticleScrapingError(
+            ScrapeFailure.MALFORMED_RESPONSE, path, external_id, "Error scraping metadata for article path"
+        ) from e
 
     return metadata
 
 
 def validate_not_excluded(page: Response) -> Optional[str]:
-    soup = BeautifulSoup(page.text, features="html.parser")
-    primary = soup.find(id="primary")
-
-    if primary:
-        classes = {value for element in primary.find_all(class_=True) for value in element["class"]}
-        if "tag-exclude" in classes:
-            return ERROR_MSG_TAG_EXCLUDE
+    soup = get_soup(page, parse_only=STRAINER)
+    # Stops at the first tagged element inside the main content area
+    if soup.select_one("#primary .tag-exclude") is not None:
+        return ERROR_MSG_TAG_EXCLUDE
 
     return None
 
@@ -117,7 +140,7 @@ def fetch_article(external_id: str, path: str) -> Response:
     url = f"https://{DOMAIN}{path}"
 
     try:
-        page = safe_get(url)
+        page = safe_get(url, scrape_config=SCRAPE_CONFIG)
     except Exception as e:
         raise ArticleScrapingError(ScrapeFailure.FETCH_ERROR, path, str(external_id), f"Request failed for {url}") from e
 
@@ -16,8 +16,22 @@ def recreate_tables(db):
     db.create_tables(MAPPINGS)
 
 
+def clear_tables(db):
+    # Children before parents so foreign keys never point at deleted rows
+    with db.atomic():
+        for mapping in reversed(MAPPINGS):
+            mapping.delete().execute()
+
+
 class BaseTest(TestCase):
+    # Schema DDL runs once per test session; later tests only clear rows
+    tables_created = False
+
     def setUp(self):
         assert isinstance(database, SqliteDatabase), "database must be sqlite for tests"
-        recreate_tables(database)
+        if BaseTest.tables_created:
+            clear_tables(database)
+        else:
+            recreate_tables(database)
+            BaseTest.tables_created = True
         super().setUp()
@@ -1,9 +1,12 @@
 from datetime import datetime
-from random import randint
+from itertools import count
 
 from db.mappings.article import Article
 from tests.factories.base import BaseFactory
 
+# Sequential ids can't collide the way random ones in a small range could
+EXTERNAL_IDS = count(1000)
+
 
 class ArticleFactory(BaseFactory):
     mapping = Article
@@ -11,4 +14,4 @@ class ArticleFactory(BaseFactory):
     @classmethod
     def make_defaults(cls):
         now = datetime.now()
-        return {"external_id": str(randint(1000, 9000)), "published_at": str(now)}
+        return {"external_id": str(next(EXTERNAL_IDS)), "published_at": str(now)}
@@ -1,6 +1,24 @@
+import time
+
+import pandas as pd
+import pytest
 from requests.models import Response
+from urllib3.response import HTTPResponse
+
+from sites.helpers import (
+    RETRY,
+    RateLimiter,
+    get_json,
+    get_rate_limiter,
+    transform_data_google_tag_manager,
+    validate_response,
+)
 
-from sites.helpers import validate_response
+
+@pytest.fixture(scope="module")
+def response() -> Response:
+    # Validators only read the response, so one instance serves every test
+    return Response()
 
 
 def _validate_good(response: Response) -> None:
@@ -11,21 +29,78 @@ def _validate_bad(response: Response) -> None:
     return "Some error message"
 
 
-def test_validate_response__single_good() -> None:
-    msg = validate_response(Response(), [_validate_good])
+def test_validate_response__single_good(response) -> None:
+    msg = validate_response(response, [_validate_good])
     assert msg is None
 
 
-def test_validate_response__single_bad() -> None:
-    msg = validate_response(Response(), [_validate_bad])
+def test_validate_response__single_bad(response) -> None:
+    msg = validate_response(response, [_validate_bad])
     assert type(msg) is str
 
 
-def test_validate_response__multiple_good() -> None:
-    msg = validate_response(Response(), [_validate_good, _validate_good])
+def test_validate_response__multiple_good(response) -> None:
+    msg = validate_response(response, [_validate_good, _validate_good])
     assert msg is None
 
 
-def test_validate_response__multiple_bad() -> None:
-    msg = validate_response(Response(), [_validate_good, _validate_bad])
+def test_validate_response__multiple_bad(response) -> None:
+    msg = validate_response(response, [_validate_good, _validate_bad])
     assert type(msg) is str
+
+
+def test_rate_limiter__paces_requests() -> None:
+    limiter = RateLimiter(requests_per_second=20)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.wait()
+    # the first request starts immediately, the next two are spaced 1/20s apart
+    assert time.monotonic() - start >= 0.1
+
+
+def test_get_rate_limiter__shared_per_host() -> None:
+    limiter = get_rate_limiter("https://www.example.com/a", 2)
+    assert get_rate_limiter("https://www.example.com/b?c=d", 2) is limiter
+    assert get_rate_limiter("https://api.example.com/a", 2) is not limiter
+
+
+def test_get_json__decodes_once() -> None:
+    response = Response()
+    response._content = b'{"_id": "TCKTFPUVXJE5LJXG7THB4PLMKM"}'
+    content = get_json(response)
+    assert content == {"_id": "TCKTFPUVXJE5LJXG7THB4PLMKM"}
+    assert get_json(response) is content
+
+
+def test_retry__backs_off_before_each_retry() -> None:
+    first = RETRY.increment(method="GET", url="/", response=HTTPResponse(status=503))
+    second = first.increment(method="GET", url="/", response=HTTPResponse(status=503))
+    assert 2 <= first.get_backoff_time() <= 2 + RETRY.JITTER
+    assert 4 <= second.get_backoff_time() <= 4 + RETRY.JITTER
+
+
+def test_retry__caps_retry_after() -> None:
+    assert RETRY.get_retry_after(HTTPResponse(status=429, headers={"Retry-After": "3600"})) == RETRY.MAX_RETRY_AFTER
+    assert RETRY.get_retry_after(HTTPResponse(status=429, headers={"Retry-After": "3"})) == 3
+
+
+@pytest.mark.parametrize("collector_tstamp", ["2021-11-12 12:45:35.123", "2021-11-12T12:45:35.123Z"])
+def test_transform_data_google_tag_manager(collector_tstamp) -> None:
+    df = pd.DataFrame(
+        {
+            "domain_userid": ["a1b2"],
+            "collector_tstamp": [collector_tstamp],
+            "page_urlpath": ["/2021/11/12/texas-legislature-special-session/"],
+            "event_name": ["page_ping"],
+        }
+    )
+    transformed_df = transform_data_google_tag_manager(df)
+
+    assert transformed_df["session_date"].dtype == "datetime64[ns]"
+    assert transformed_df["landing_page_path"].dtype == "category"
+    assert transformed_df["event_name"].dtype == "category"
+    # Redshift's COPY reads session_date with DATEFORMAT 'YYYY-MM-DD'
+    row = transformed_df.to_csv(index=False, sep="\t").splitlines()[1].split("\t")
+    assert row[0] == "a1b2"
+    assert row[1].startswith("2021-11-12 12:45:35")
+    assert row[2:] == ["2021-11-12", "/2021/11/12/texas-legislature-special-session/", "page_ping"]
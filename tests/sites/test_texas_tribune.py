@@ -0,0 +1,135 @@
+from copy import deepcopy
+from datetime import date
+from io import BytesIO
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests.models import Response
+from urllib3.response import HTTPResponse
+
+import sites.texas_tribune as site
+from sites.helpers import ArticleBulkScrapingError, ArticleScrapingError, ScrapeFailure
+from tests.base import BaseTest
+
+
+def html_response(body: bytes, headers: Optional[dict] = None) -> Response:
+    res = Response()
+    res.status_code = 200
+    res.headers.update(headers or {})
+    res.raw = HTTPResponse(body=BytesIO(body), headers=headers, preload_content=False)
+    return res
+
+
+class TestTexasTribune(BaseTest):
+    def setUp(self) -> None:
+        res = {
+            "id": 38319,
+            "headline": "Texas Legislature adjourns special session",
+            "pub_date": "2021-11-12T12:45:35-06:00",
+            "url": "https://www.texastribune.org/2021/11/12/texas-legislature-special-session/",
+        }
+        self.res = deepcopy(res)
+        super().setUp()
+
+    def test_parse_metadata(self) -> None:
+        metadata = site.parse_metadata(self.res)
+        assert metadata == {
+            "title": self.res["headline"],
+            "published_at": self.res["pub_date"],
+            "path": "/2021/11/12/texas-legislature-special-session/",
+            "external_id": self.res["id"],
+        }
+
+    def test_parse_metadata__missing_key(self) -> None:
+        del self.res["headline"]
+        with pytest.raises(ArticleScrapingError) as e:
+            site.parse_metadata(self.res, "38319", "/2021/11/12/texas-legislature-special-session/")
+        assert e.value.error_type == ScrapeFailure.MALFORMED_RESPONSE
+        assert e.value.path == "/2021/11/12/texas-legislature-special-session/"
+        assert e.value.external_id == "38319"
+
+    def paginated_api(self, count: int, max_limit: int):
+        def get_page(url, params, scrape_config):
+            res = MagicMock()
+            offset = params["offset"]
+            limit = min(params["limit"], max_limit)
+            res.json.return_value = {
+                "count": count,
+                "results": [{**self.res, "id": i} for i in range(offset, min(offset + limit, count))],
+            }
+            return res
+
+        return get_page
+
+    @patch("sites.texas_tribune.safe_get")
+    def test_bulk_fetch__paginated(self, mock_safe_get) -> None:
+        mock_safe_get.side_effect = self.paginated_api(count=150, max_limit=100)
+        metadata = site.bulk_fetch(date(2021, 11, 12), date(2021, 11, 13))
+        assert mock_safe_get.call_count == 2
+        assert [m["external_id"] for m in metadata] == list(range(150))
+
+    @patch("sites.texas_tribune.safe_get")
+    def test_bulk_fetch__server_caps_page_size(self, mock_safe_get) -> None:
+        mock_safe_get.side_effect = self.paginated_api(count=150, max_limit=40)
+        metadata = site.bulk_fetch(date(2021, 11, 12), date(2021, 11, 13))
+        assert mock_safe_get.call_count == 4
+        assert [m["external_id"] for m in metadata] == list(range(150))
+
+    @patch("sites.texas_tribune.safe_get")
+    def test_bulk_fetch__malformed_page(self, mock_safe_get) -> None:
+        get_page = self.paginated_api(count=150, max_limit=100)
+
+        def get_malformed_page(url, params, scrape_config):
+            if params["offset"]:
+                res = MagicMock()
+                res.json.return_value = {"detail": "Invalid page."}
+                return res
+            return get_page(url, params, scrape_config)
+
+        mock_safe_get.side_effect = get_malformed_page
+        with pytest.raises(ArticleBulkScrapingError) as e:
+            site.bulk_fetch(date(2021, 11, 12), date(2021, 11, 13))
+        assert e.value.errorType == ScrapeFailure.FETCH_ERROR
+
+    @patch("sites.texas_tribune.safe_get")
+    def test_extract_external_id(self, mock_safe_get) -> None:
+        mock_safe_get.return_value = html_response(b"<html><script>tt = {contentID: '38319'}</script></html>")
+        assert site.extract_external_id("/2021/11/12/texas-legislature-special-session/") == "38319"
+
+    @patch("sites.texas_tribune.safe_get")
+    def test_extract_external_id__split_across_chunks(self, mock_safe_get) -> None:
+        padding = b"x" * (64 * 1024 - 5)
+        mock_safe_get.return_value = html_response(padding + b"contentID: '38320'</script>")
+        assert site.extract_external_id("/2021/11/12/long-page/") == "38320"
+
+    @patch("sites.texas_tribune.safe_get")
+    def test_extract_external_id__drains_short_tail(self, mock_safe_get) -> None:
+        body = b"<script>tt = {contentID: '38321'}</script>" + b"x" * (100 * 1024)
+        res = html_response(body)
+        mock_safe_get.return_value = res
+        assert site.extract_external_id("/2021/11/12/short-tail/") == "38321"
+        # the whole body was read, so the connection can be reused
+        assert res.raw.tell() == len(body)
+
+    @patch("sites.texas_tribune.safe_get")
+    def test_extract_external_id__leaves_long_tail(self, mock_safe_get) -> None:
+        body = b"<script>tt = {contentID: '38322'}</script>" + b"x" * (1024 * 1024)
+        res = html_response(body, headers={"Content-Length": str(len(body))})
+        mock_safe_get.return_value = res
+        assert site.extract_external_id("/2021/11/12/long-tail/") == "38322"
+        assert res.raw.tell() < len(body)
+
+    @patch("sites.texas_tribune.safe_get")
+    def test_extract_external_id__not_found(self, mock_safe_get) -> None:
+        mock_safe_get.return_value = html_response(b"<html><body>No content ID here</body></html>")
+        with pytest.raises(ArticleScrapingError) as e:
+            site.extract_external_id("/2021/11/12/no-content-id/")
+        assert e.value.error_type == ScrapeFailure.NO_EXTERNAL_ID
+
+    @patch("sites.texas_tribune.safe_get")
+    def test_extract_external_id__non_article_path(self, mock_safe_get) -> None:
+        with pytest.raises(ArticleScrapingError) as e:
+            site.extract_external_id("/about/staff/")
+        assert e.value.error_type == ScrapeFailure.NO_EXTERNAL_ID
+        mock_safe_get.assert_not_called()
@@ -0,0 +1,35 @@
+import pytest
+
+import sites.washington_city_paper as site
+from sites.helpers import ArticleScrapingError, ScrapeFailure
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/v/s/washingtoncitypaper.com/article/194506/10-things-you-didnt-know-about-steakumm/",
+        "/c/s/washingtoncitypaper.com/article/194506/10-things-you-didnt-know-about-steakumm/",
+        "/article/521676/jack-evans-will-pay-2000-a-month-in-latest-ethics-settlement/",
+        "/article/521676/",
+        "/article/52a/some-slug/",
+        "/article/\uff11\uff12/some-slug/",
+        "/article/12/\u00a0slug/",
+        "/news/article/521676/some-slug/",
+        "/v/s/washingtoncitypaper.com/article/194506/",
+        "/v/s/washingtoncitypaperxcom/article/194506/some-slug/",
+    ],
+)
+def test_split_external_id__matches_regex(path) -> None:
+    result = site.PATH_PROG.match(path)
+    expected = result.group(1) if result else None
+    assert site.split_external_id(path) == expected
+
+
+def test_extract_external_id() -> None:
+    assert site.extract_external_id("/article/521676/jack-evans/") == "521676"
+
+
+def test_extract_external_id__not_found() -> None:
+    with pytest.raises(ArticleScrapingError) as e:
+        site.extract_external_id("/about/")
+    assert e.value.error_type == ScrapeFailure.NO_EXTERNAL_ID
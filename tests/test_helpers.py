@@ -71,7 +71,7 @@ def _test_similarities(embeddings: np.ndarray, n_recs: int, decays: np.ndarray):
     knn_index = KNN(embeddings, np.unique(decays))
     similarities, indices = knn_index.get_similar_indices(n_recs)
     assert similarities.shape == (4, n_recs)
-    assert all([similarities[i, 0] == 1.0 for i in range(similarities.shape[0])])
+    assert (similarities[:, 0] == 1.0).all()
     return similarities, indices
 
 